@@ -15,19 +15,35 @@ Endpoints:
 - GET /api/reports/bureau/{bureau_name} - List reports by bureau
 """
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Body, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from starlette.concurrency import run_in_threadpool
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, timedelta
 from enum import Enum
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from os import urandom
+import asyncio
+import msgspec
+import numpy as np
+import orjson
+import os
 import random
-import uuid
+import threading
+
+# Single PCG64 generator shared by all generation paths; batched draws from
+# it replace per-field random.* calls in the hot loops
+rng = np.random.default_rng()
 
 app = FastAPI(
     title="Multi-Bureau Credit Report API",
     description="Generate credit reports for Equifax, TransUnion, and Experian",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -38,45 +54,119 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Reports are 5-15KB of highly compressible JSON; level 1 keeps the CPU
+# cost low while still collapsing the repetitive payment histories
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Storage
-credit_reports_db: Dict[str, Dict[Any, Any]] = {}
+# Insertion-ordered so the store can evict its oldest entries once it grows
+# past MAX_REPORTS; keeps memory bounded under /generate-unlimited
+MAX_REPORTS = int(os.environ.get("MAX_REPORTS", "100000"))
+credit_reports_db: "OrderedDict[str, Any]" = OrderedDict()
+# Reports are immutable once generated, so serialize each one exactly once
+# and hand the cached bytes straight back on GET
+report_bytes_db: Dict[str, bytes] = {}
+# Lightweight per-report metadata for list/filter endpoints, cached both as
+# a dict (for filtering) and as pre-encoded bytes (for responses)
+report_meta: Dict[str, Dict[str, Any]] = {}
+report_summary_bytes: Dict[str, bytes] = {}
+# Secondary index and running counts maintained at insert so the bureau
+# filter endpoints and /api/stats never scan the whole store
+bureau_index: Dict[str, List[str]] = {"equifax": [], "transunion": [], "experian": []}
+bureau_counts: Dict[str, int] = {"equifax": 0, "transunion": 0, "experian": 0}
+# Flat list of live ids so random picks use randrange/sample directly
+# instead of copying every key out of the dict per request. The position
+# maps make removal O(1) via swap-with-last, so the lists are unordered.
+report_ids: List[str] = []
+_report_pos: Dict[str, int] = {}
+_bureau_pos: Dict[str, Dict[str, int]] = {"equifax": {}, "transunion": {}, "experian": {}}
+# Inserts run from threadpool threads (POST /generate) and the event loop
+# (/generate-unlimited) concurrently; the lock keeps the five parallel
+# structures mutating as one unit so eviction never sees stale positions
+_store_lock = threading.Lock()
+
+def _remove_id(ids, positions, rid):
+    """O(1) list removal: move the last id into the removed slot"""
+    i = positions.pop(rid)
+    last = ids.pop()
+    if last != rid:
+        ids[i] = last
+        positions[last] = i
+
+def _evict_oldest():
+    """Drop the oldest report from the store and every parallel structure.
+
+    Caller must hold _store_lock.
+    """
+    old_id, _ = credit_reports_db.popitem(last=False)
+    del report_bytes_db[old_id]
+    del report_summary_bytes[old_id]
+    old_meta = report_meta.pop(old_id)
+    bureau = old_meta["bureau"].lower()
+    bureau_counts[bureau] -= 1
+    _remove_id(report_ids, _report_pos, old_id)
+    _remove_id(bureau_index[bureau], _bureau_pos[bureau], old_id)
+
+def _store_report(report_id, report, meta, bureau_value):
+    # Serialize outside the lock; only the structure updates need it
+    report_bytes = msgspec.json.encode(report)
+    summary_bytes = orjson.dumps(meta)
+    with _store_lock:
+        credit_reports_db[report_id] = report
+        report_bytes_db[report_id] = report_bytes
+        report_meta[report_id] = meta
+        report_summary_bytes[report_id] = summary_bytes
+        _bureau_pos[bureau_value][report_id] = len(bureau_index[bureau_value])
+        bureau_index[bureau_value].append(report_id)
+        bureau_counts[bureau_value] += 1
+        _report_pos[report_id] = len(report_ids)
+        report_ids.append(report_id)
+        if len(credit_reports_db) > MAX_REPORTS:
+            _evict_oldest()
 
 @app.on_event("startup")
 async def startup_event():
     """Generate 50 sample reports on startup"""
     print("🚀 Generating 50 sample reports on startup...")
-    
+
     # Generate reports with different profiles
     profiles = ["excellent", "good", "fair", "poor"]
     bureaus = [Bureau.EQUIFAX, Bureau.TRANSUNION, Bureau.EXPERIAN]
-    
-    for i in range(50):
-        # Rotate through different profiles and bureaus
-        profile = profiles[i % len(profiles)]
-        bureau = bureaus[i % len(bureaus)]
-        
-        request = ReportGenerateRequest(
-            bureau=bureau,
-            credit_profile=CreditProfile(profile),
-            num_accounts=random.randint(3, 7)
+
+    # Rotate through different profiles and bureaus; build the whole batch
+    # in the process pool and insert the results here
+    pool = _get_process_pool()
+    loop = asyncio.get_running_loop()
+    jobs = [
+        loop.run_in_executor(
+            pool, _build_reports,
+            bureaus[i % len(bureaus)],
+            CreditProfile(profiles[i % len(profiles)]),
+            int(rng.integers(3, 8))
         )
-        
-        try:
-            generate_credit_reports(request)
-        except Exception as e:
-            print(f"Error generating report {i+1}: {e}")
-    
+        for i in range(50)
+    ]
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"Error generating report {i+1}: {result}")
+            continue
+        built = result[0]
+        for report_id, report, meta, bureau_value in built:
+            _store_report(report_id, report, meta, bureau_value)
+
     print(f"✅ Successfully generated {len(credit_reports_db)} sample reports")
-    
+
     # Print statistics
-    bureau_counts = {"equifax": 0, "transunion": 0, "experian": 0}
-    for report in credit_reports_db.values():
-        bureau = report.get("bureau", "").lower()
-        if bureau in bureau_counts:
-            bureau_counts[bureau] += 1
-    
     print(f"📊 Reports by bureau: {bureau_counts}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
 # Enums
 class Bureau(str, Enum):
     EQUIFAX = "equifax"
@@ -103,11 +193,21 @@ CITIES = [
 ]
 STREET_NAMES = ["Main", "Oak", "Pine", "Maple", "Cedar", "Elm", "Washington"]
 STREET_TYPES = ["St", "Ave", "Blvd", "Dr", "Ln", "Rd"]
+
+# Flattened parallel arrays so generate_address indexes instead of
+# unpacking (city, state, zip) tuples and re-parsing zip codes per call
+CITY_NAMES = tuple(c[0] for c in CITIES)
+CITY_STATES = tuple(c[1] for c in CITIES)
+CITY_ZIPS_INT = tuple(int(c[2]) for c in CITIES)
+# All "street type" combinations pre-joined; addressLine1 needs one concat
+STREET_COMBOS = tuple(f"{s} {t}" for s in STREET_NAMES for t in STREET_TYPES)
 EMPLOYERS = ["Tech Solutions Inc", "Global Consulting Group", "Retail America Corp"]
 JOB_TITLES = ["Manager", "Analyst", "Engineer", "Developer", "Consultant"]
 BANKS = ["Wells Fargo", "Bank of America", "Chase", "Citibank", "US Bank"]
 CREDIT_CARDS = ["American Express", "Discover", "Capital One", "Barclays"]
 AUTO_LENDERS = ["Toyota Financial", "GM Financial", "Ford Credit"]
+ACCOUNT_TYPES = ("credit_card", "auto_loan", "mortgage")
+CUSTOMER_PREFIXES = ("BB", "FA", "MT")
 
 # Helper functions
 def generate_ssn():
@@ -119,301 +219,507 @@ def generate_dob():
     day = random.randint(1, 28)
     return f"{month:02d}{day:02d}{year}"
 
-def generate_date(days_ago_max=3650):
+# Both date helpers take the current time as an argument: callers grab
+# datetime.now() once per report instead of paying a clock read plus
+# datetime construction for every generated date field
+def generate_date(now, days_ago_max=3650):
     days_ago = random.randint(30, days_ago_max)
-    date = datetime.now() - timedelta(days=days_ago)
+    date = now - timedelta(days=days_ago)
     return date.strftime("%m%d%Y")
 
-def generate_iso_date(days_ago_max=3650):
+def generate_iso_date(now, days_ago_max=3650):
     days_ago = random.randint(30, days_ago_max)
-    date = datetime.now() - timedelta(days=days_ago)
+    date = now - timedelta(days=days_ago)
     return date.isoformat()
 
 def generate_address():
-    house_num = random.randint(100, 9999)
-    street = random.choice(STREET_NAMES)
-    street_type = random.choice(STREET_TYPES)
-    city, state, zip_code = random.choice(CITIES)
+    house_num = int(rng.integers(100, 10000))
+    street_i = rng.integers(0, len(STREET_NAMES))
+    type_i = rng.integers(0, len(STREET_TYPES))
+    city_i = rng.integers(0, len(CITY_NAMES))
     return {
         "houseNumber": house_num,
-        "streetName": street,
-        "streetType": street_type,
-        "cityName": city,
-        "stateAbbreviation": state,
-        "zipCode": int(zip_code),
-        "addressLine1": f"{house_num} {street} {street_type}"
+        "streetName": STREET_NAMES[street_i],
+        "streetType": STREET_TYPES[type_i],
+        "cityName": CITY_NAMES[city_i],
+        "stateAbbreviation": CITY_STATES[city_i],
+        "zipCode": CITY_ZIPS_INT[city_i],
+        "addressLine1": f"{house_num} {STREET_COMBOS[street_i * len(STREET_TYPES) + type_i]}"
     }
 
+# (score_lo, score_hi, delinquencies_lo, delinquencies_hi) per profile;
+# get_credit_profile draws two scalars from the bounds of the one profile
+# it needs instead of rebuilding a dict of draws for all four
+PROFILE_BOUNDS = {
+    "excellent": (750, 850, 0, 0),
+    "good": (670, 749, 0, 1),
+    "fair": (580, 669, 1, 3),
+    "poor": (300, 579, 3, 6)
+}
+PROFILE_NAMES = tuple(PROFILE_BOUNDS)
+
 def get_credit_profile(profile_type):
-    profiles = {
-        "excellent": {"score": random.randint(750, 850), "delinquencies": 0},
-        "good": {"score": random.randint(670, 749), "delinquencies": random.randint(0, 1)},
-        "fair": {"score": random.randint(580, 669), "delinquencies": random.randint(1, 3)},
-        "poor": {"score": random.randint(300, 579), "delinquencies": random.randint(3, 6)}
-    }
     if profile_type == "random":
-        profile_type = random.choice(list(profiles.keys()))
-    return profile_type, profiles.get(profile_type, profiles["good"])
+        profile_type = PROFILE_NAMES[rng.integers(0, len(PROFILE_NAMES))]
+    score_lo, score_hi, delinq_lo, delinq_hi = PROFILE_BOUNDS.get(profile_type, PROFILE_BOUNDS["good"])
+    return profile_type, {
+        "score": int(rng.integers(score_lo, score_hi + 1)),
+        "delinquencies": int(rng.integers(delinq_lo, delinq_hi + 1))
+    }
 
-def generate_payment_history(profile_range, format="equifax"):
-    months = 24
-    if profile_range == "excellent":
-        codes = [1] * months
-    elif profile_range == "good":
-        codes = [1] * (months - 2) + [2] * 2
-    elif profile_range == "fair":
-        codes = [1] * (months - 5) + [2, 2, 3, 2, 1]
-    else:
-        codes = [1] * (months - 8) + [2, 3, 4, 3, 2, 3, 4, 2]
-    
-    random.shuffle(codes)
-    
+PAYMENT_HISTORY_MONTHS = 24
+# Immutable per-profile code templates; calls permute indices into these
+# instead of building and shuffling a fresh list
+PROFILE_BASE_CODES = {
+    "excellent": (1,) * PAYMENT_HISTORY_MONTHS,
+    "good": (1,) * (PAYMENT_HISTORY_MONTHS - 2) + (2, 2),
+    "fair": (1,) * (PAYMENT_HISTORY_MONTHS - 5) + (2, 2, 3, 2, 1),
+    "poor": (1,) * (PAYMENT_HISTORY_MONTHS - 8) + (2, 3, 4, 3, 2, 3, 4, 2)
+}
+
+EQUIFAX_CODE_DESCRIPTIONS = {
+    1: "Pays account as agreed",
+    2: "Not more than two payments past due",
+    3: "Not more than three payments past due",
+    4: "Not more than four payments past due"
+}
+
+# The innermost repetitive objects are msgspec Structs rather than dicts:
+# tens of them per report, so the slimmer layout and C-level encoding add up
+class PaymentEntry(msgspec.Struct, frozen=True):
+    code: Union[int, str]
+    description: str
+
+def _payment_entry(code, format):
     if format == "transunion":
         # TransUnion uses different codes
-        return [{"code": f"R{code}" if code <= 4 else "R9", 
-                "description": f"Payment status {code}"} for code in codes]
+        return PaymentEntry(code=f"R{code}" if code <= 4 else "R9",
+                            description=f"Payment status {code}")
     elif format == "experian":
         # Experian uses 0-9 scale
-        return [{"code": str(code) if code <= 9 else "9", 
-                "description": f"Payment status {code}"} for code in codes]
+        return PaymentEntry(code=str(code) if code <= 9 else "9",
+                            description=f"Payment status {code}")
     else:  # equifax
-        descriptions = {
-            1: "Pays account as agreed",
-            2: "Not more than two payments past due",
-            3: "Not more than three payments past due",
-            4: "Not more than four payments past due"
-        }
-        return [{"code": code, "description": descriptions.get(code, "Status unknown")} 
-                for code in codes]
+        return PaymentEntry(code=code,
+                            description=EQUIFAX_CODE_DESCRIPTIONS.get(code, "Status unknown"))
+
+# One shared entry dict per (format, code), built once at import. Payment
+# histories reference these instead of allocating 24 fresh dicts per trade;
+# all consumers treat them as read-only.
+PAYMENT_ENTRIES = {
+    fmt: {code: _payment_entry(code, fmt) for code in (1, 2, 3, 4)}
+    for fmt in ("equifax", "transunion", "experian")
+}
+
+def generate_payment_history(profile_range, format="equifax"):
+    codes = PROFILE_BASE_CODES.get(profile_range, PROFILE_BASE_CODES["poor"])
+    entries = PAYMENT_ENTRIES.get(format, PAYMENT_ENTRIES["equifax"])
+    order = rng.permutation(PAYMENT_HISTORY_MONTHS)
+    return [entries[codes[i]] for i in order]
 
 # EQUIFAX Report Generator
-def generate_equifax_report(first_name, last_name, middle_initial, ssn, dob, 
-                           profile_range, profile_data, current_addr, former_addr, num_accounts):
+# Each bureau's full schema is a Struct graph: msgspec's encoder is
+# specialized to the shape, so serialization skips dict hashing and key
+# interning entirely. The metadata fields are attached after construction,
+# matching the old post-hoc dict assignment.
+class SubjectName(msgspec.Struct):
+    firstName: str
+    lastName: str
+    middleName: str
+
+class EquifaxScoreModel(msgspec.Struct):
+    type: str
+    modelNumber: str
+    score: int
+
+class EquifaxConsumerReport(msgspec.Struct):
+    subjectName: SubjectName
+    subjectSocialNum: int
+    birthDate: str
+    addresses: List[Dict[str, Any]]
+    trades: List["EquifaxTrade"]
+    models: List[EquifaxScoreModel]
+
+class EquifaxReport(msgspec.Struct, omit_defaults=True):
+    bureau: str
+    consumers: Dict[str, List[EquifaxConsumerReport]]
+    reportId: Optional[str] = None
+    generatedDate: Optional[str] = None
+    riskProfile: Optional[str] = None
+
+class EquifaxTrade(msgspec.Struct):
+    customerNumber: str
+    accountNumber: int
+    dateReported: str
+    dateOpened: str
+    rate: Dict[str, int]
+    paymentHistory1to24: List[PaymentEntry]
+    lastActivityDate: str
+    customerName: str
+    highCredit: int
+    accountTypeCode: Dict[str, Any]
+
+# Shared accountTypeCode sub-docs; referenced, never copied, by every trade
+EQUIFAX_TYPE_CODES = {
+    "credit_card": {"code": 18, "description": "Credit Card"},
+    "auto_loan": {"code": 0, "description": "Auto"},
+    "mortgage": {"code": 1, "description": "Mortgage"}
+}
+
+def _equifax_credit_card_fields(n):
+    names = random.choices(CREDIT_CARDS, k=n)
+    high_credits = rng.integers(1000, 25001, size=n).tolist()
+    return [{"customerName": name, "highCredit": high,
+             "accountTypeCode": EQUIFAX_TYPE_CODES["credit_card"]}
+            for name, high in zip(names, high_credits)]
+
+def _equifax_auto_loan_fields(n):
+    names = random.choices(AUTO_LENDERS, k=n)
+    high_credits = rng.integers(10000, 50001, size=n).tolist()
+    return [{"customerName": name, "highCredit": high,
+             "accountTypeCode": EQUIFAX_TYPE_CODES["auto_loan"]}
+            for name, high in zip(names, high_credits)]
+
+def _equifax_mortgage_fields(n):
+    names = random.choices(BANKS, k=n)
+    high_credits = rng.integers(100000, 500001, size=n).tolist()
+    return [{"customerName": name, "highCredit": high,
+             "accountTypeCode": EQUIFAX_TYPE_CODES["mortgage"]}
+            for name, high in zip(names, high_credits)]
+
+EQUIFAX_TRADE_BUILDERS = {
+    "credit_card": _equifax_credit_card_fields,
+    "auto_loan": _equifax_auto_loan_fields,
+    "mortgage": _equifax_mortgage_fields
+}
+
+def generate_equifax_report(first_name, last_name, middle_initial, ssn, dob,
+                           profile_range, profile_data, addresses, num_accounts, now):
     trades = []
-    for _ in range(num_accounts):
-        account_type = random.choice(["credit_card", "auto_loan", "mortgage"])
-        trade = {
-            "customerNumber": f"999{random.choice(['BB', 'FA', 'MT'])}{random.randint(10000, 99999)}",
-            "accountNumber": random.randint(100000, 999999999),
-            "dateReported": generate_date(365),
-            "dateOpened": generate_date(),
-            "rate": {"code": 1 if profile_range in ["excellent", "good"] else random.randint(1, 3)},
-            "paymentHistory1to24": generate_payment_history(profile_range, "equifax"),
-            "lastActivityDate": generate_date(180)
-        }
-        
-        if account_type == "credit_card":
-            trade.update({
-                "customerName": random.choice(CREDIT_CARDS),
-                "highCredit": random.randint(1000, 25000),
-                "accountTypeCode": {"code": 18, "description": "Credit Card"}
-            })
-        elif account_type == "auto_loan":
-            trade.update({
-                "customerName": random.choice(AUTO_LENDERS),
-                "highCredit": random.randint(10000, 50000),
-                "accountTypeCode": {"code": 0, "description": "Auto"}
-            })
-        else:
-            trade.update({
-                "customerName": random.choice(BANKS),
-                "highCredit": random.randint(100000, 500000),
-                "accountTypeCode": {"code": 1, "description": "Mortgage"}
-            })
-        trades.append(trade)
+    # One draw decides how many accounts of each type; the dispatch table
+    # supplies each type's fields in bulk, no branch per trade
+    type_counts = np.bincount(
+        rng.integers(0, len(ACCOUNT_TYPES), size=num_accounts),
+        minlength=len(ACCOUNT_TYPES)
+    )
+    good_profile = profile_range in ("excellent", "good")
+    for account_type, n in zip(ACCOUNT_TYPES, type_counts):
+        n = int(n)
+        if n == 0:
+            continue
+        prefix_indices = rng.integers(0, len(CUSTOMER_PREFIXES), size=n)
+        customer_numbers = rng.integers(10000, 100000, size=n).tolist()
+        account_numbers = rng.integers(100000, 1000000000, size=n).tolist()
+        rate_codes = [1] * n if good_profile else rng.integers(1, 4, size=n).tolist()
+        typed_fields = EQUIFAX_TRADE_BUILDERS[account_type](n)
+        for i in range(n):
+            trades.append(EquifaxTrade(
+                customerNumber=f"999{CUSTOMER_PREFIXES[prefix_indices[i]]}{customer_numbers[i]}",
+                accountNumber=account_numbers[i],
+                dateReported=generate_date(now, 365),
+                dateOpened=generate_date(now),
+                rate={"code": rate_codes[i]},
+                paymentHistory1to24=generate_payment_history(profile_range, "equifax"),
+                lastActivityDate=generate_date(now, 180),
+                **typed_fields[i]
+            ))
     
-    return {
-        "bureau": "Equifax",
-        "consumers": {
-            "equifaxUSConsumerCreditReport": [{
-                "subjectName": {
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "middleName": middle_initial
-                },
-                "subjectSocialNum": ssn,
-                "birthDate": dob,
-                "addresses": [current_addr, former_addr],
-                "trades": trades,
-                "models": [{
-                    "type": "FICO",
-                    "modelNumber": "08",
-                    "score": profile_data["score"]
-                }]
-            }]
+    return EquifaxReport(
+        bureau="Equifax",
+        consumers={
+            "equifaxUSConsumerCreditReport": [EquifaxConsumerReport(
+                subjectName=SubjectName(
+                    firstName=first_name,
+                    lastName=last_name,
+                    middleName=middle_initial
+                ),
+                subjectSocialNum=ssn,
+                birthDate=dob,
+                addresses=addresses,
+                trades=trades,
+                models=[EquifaxScoreModel(
+                    type="FICO",
+                    modelNumber="08",
+                    score=profile_data["score"]
+                )]
+            )]
         }
-    }
+    )
+
+# TRANSUNION Report Generator
+class TransUnionBorrower(msgspec.Struct):
+    firstName: str
+    lastName: str
+    middleName: str
+    ssn: int
+    birthDate: str
+    addresses: List[Dict[str, Any]]
+
+class TransUnionCreditScore(msgspec.Struct):
+    model: str
+    score: int
+    scoreFactors: List[Dict[str, str]]
+
+class TransUnionCreditFile(msgspec.Struct):
+    tradelines: List["TransUnionTradeline"]
+    creditScore: TransUnionCreditScore
+
+class TransUnionCreditResponse(msgspec.Struct):
+    CreditRepositorySourceType: str
+    BORROWER: TransUnionBorrower
+    CREDIT_FILE: TransUnionCreditFile
+
+class TransUnionReport(msgspec.Struct, omit_defaults=True):
+    bureau: str
+    CREDIT_RESPONSE: TransUnionCreditResponse
+    reportId: Optional[str] = None
+    generatedDate: Optional[str] = None
+    riskProfile: Optional[str] = None
+
+# Shared immutable score-factor sub-doc
+TRANSUNION_SCORE_FACTORS = [{"code": "01", "description": "Credit utilization"}]
+
+# Field sets differ per account type; unset optionals are omitted from the
+# encoded JSON so the wire format matches the old per-type dicts
+class TransUnionTradeline(msgspec.Struct, omit_defaults=True):
+    accountNumber: int
+    accountType: str
+    dateOpened: str
+    dateReported: str
+    paymentHistory: List[PaymentEntry]
+    accountRating: str
+    creditorName: str
+    creditLimit: Optional[int] = None
+    currentBalance: Optional[int] = None
+    originalAmount: Optional[int] = None
+    monthlyPayment: Optional[int] = None
+
+def _transunion_credit_card_fields(n):
+    names = random.choices(CREDIT_CARDS, k=n)
+    limits = rng.integers(1000, 25001, size=n).tolist()
+    balances = rng.integers(0, 10001, size=n).tolist()
+    return [{"creditorName": name, "creditLimit": limit, "currentBalance": balance}
+            for name, limit, balance in zip(names, limits, balances)]
+
+def _transunion_auto_loan_fields(n):
+    names = random.choices(AUTO_LENDERS, k=n)
+    amounts = rng.integers(10000, 50001, size=n).tolist()
+    payments = rng.integers(200, 601, size=n).tolist()
+    return [{"creditorName": name, "originalAmount": amount, "monthlyPayment": payment}
+            for name, amount, payment in zip(names, amounts, payments)]
+
+def _transunion_mortgage_fields(n):
+    names = random.choices(BANKS, k=n)
+    amounts = rng.integers(100000, 500001, size=n).tolist()
+    payments = rng.integers(800, 3501, size=n).tolist()
+    return [{"creditorName": name, "originalAmount": amount, "monthlyPayment": payment}
+            for name, amount, payment in zip(names, amounts, payments)]
+
+TRANSUNION_TRADELINE_BUILDERS = {
+    "credit_card": _transunion_credit_card_fields,
+    "auto_loan": _transunion_auto_loan_fields,
+    "mortgage": _transunion_mortgage_fields
+}
 
-# TRANSUNION Report Generator  
 def generate_transunion_report(first_name, last_name, middle_initial, ssn, dob,
-                               profile_range, profile_data, current_addr, former_addr, num_accounts):
+                               profile_range, profile_data, addresses, num_accounts, now):
     tradelines = []
-    for _ in range(num_accounts):
-        account_type = random.choice(["credit_card", "auto_loan", "mortgage"])
-        tradeline = {
-            "accountNumber": random.randint(100000, 999999999),
-            "accountType": account_type.replace("_", " ").title(),
-            "dateOpened": generate_iso_date(),
-            "dateReported": generate_iso_date(365),
-            "paymentHistory": generate_payment_history(profile_range, "transunion"),
-            "accountRating": "R1" if profile_range in ["excellent", "good"] else "R2"
-        }
-        
-        if account_type == "credit_card":
-            tradeline.update({
-                "creditorName": random.choice(CREDIT_CARDS),
-                "creditLimit": random.randint(1000, 25000),
-                "currentBalance": random.randint(0, 10000)
-            })
-        elif account_type == "auto_loan":
-            tradeline.update({
-                "creditorName": random.choice(AUTO_LENDERS),
-                "originalAmount": random.randint(10000, 50000),
-                "monthlyPayment": random.randint(200, 600)
-            })
-        else:
-            tradeline.update({
-                "creditorName": random.choice(BANKS),
-                "originalAmount": random.randint(100000, 500000),
-                "monthlyPayment": random.randint(800, 3500)
-            })
-        tradelines.append(tradeline)
+    type_counts = np.bincount(
+        rng.integers(0, len(ACCOUNT_TYPES), size=num_accounts),
+        minlength=len(ACCOUNT_TYPES)
+    )
+    account_rating = "R1" if profile_range in ("excellent", "good") else "R2"
+    for account_type, n in zip(ACCOUNT_TYPES, type_counts):
+        n = int(n)
+        if n == 0:
+            continue
+        account_numbers = rng.integers(100000, 1000000000, size=n).tolist()
+        account_type_name = account_type.replace("_", " ").title()
+        typed_fields = TRANSUNION_TRADELINE_BUILDERS[account_type](n)
+        for i in range(n):
+            tradelines.append(TransUnionTradeline(
+                accountNumber=account_numbers[i],
+                accountType=account_type_name,
+                dateOpened=generate_iso_date(now),
+                dateReported=generate_iso_date(now, 365),
+                paymentHistory=generate_payment_history(profile_range, "transunion"),
+                accountRating=account_rating,
+                **typed_fields[i]
+            ))
     
-    return {
-        "bureau": "TransUnion",
-        "CREDIT_RESPONSE": {
-            "CreditRepositorySourceType": "TransUnion",
-            "BORROWER": {
-                "firstName": first_name,
-                "lastName": last_name,
-                "middleName": middle_initial,
-                "ssn": ssn,
-                "birthDate": dob,
-                "addresses": [
-                    {
-                        "type": "Current",
-                        "street": current_addr["addressLine1"],
-                        "city": current_addr["cityName"],
-                        "state": current_addr["stateAbbreviation"],
-                        "zip": current_addr["zipCode"]
-                    },
-                    {
-                        "type": "Prior",
-                        "street": former_addr["addressLine1"],
-                        "city": former_addr["cityName"],
-                        "state": former_addr["stateAbbreviation"],
-                        "zip": former_addr["zipCode"]
-                    }
-                ]
-            },
-            "CREDIT_FILE": {
-                "tradelines": tradelines,
-                "creditScore": {
-                    "model": "VantageScore 3.0",
-                    "score": profile_data["score"],
-                    "scoreFactors": [
-                        {"code": "01", "description": "Credit utilization"}
-                    ]
-                }
-            }
-        }
-    }
+    return TransUnionReport(
+        bureau="TransUnion",
+        CREDIT_RESPONSE=TransUnionCreditResponse(
+            CreditRepositorySourceType="TransUnion",
+            BORROWER=TransUnionBorrower(
+                firstName=first_name,
+                lastName=last_name,
+                middleName=middle_initial,
+                ssn=ssn,
+                birthDate=dob,
+                addresses=addresses
+            ),
+            CREDIT_FILE=TransUnionCreditFile(
+                tradelines=tradelines,
+                creditScore=TransUnionCreditScore(
+                    model="VantageScore 3.0",
+                    score=profile_data["score"],
+                    scoreFactors=TRANSUNION_SCORE_FACTORS
+                )
+            )
+        )
+    )
 
 # EXPERIAN Report Generator
+class ExperianName(msgspec.Struct):
+    firstName: str
+    middleName: str
+    lastName: str
+
+class ExperianConsumerIdentity(msgspec.Struct):
+    name: ExperianName
+    ssn: int
+    dateOfBirth: str
+    addresses: List[Dict[str, Any]]
+
+class ExperianCreditScore(msgspec.Struct):
+    scoreName: str
+    scoreValue: int
+    scoreFactors: List[Dict[str, str]]
+
+class ExperianCreditProfile(msgspec.Struct):
+    consumerIdentity: ExperianConsumerIdentity
+    creditAccounts: List["ExperianAccount"]
+    creditScore: ExperianCreditScore
+    inquiries: List["ExperianInquiry"]
+
+class ExperianReport(msgspec.Struct, omit_defaults=True):
+    bureau: str
+    creditProfile: ExperianCreditProfile
+    reportId: Optional[str] = None
+    generatedDate: Optional[str] = None
+    riskProfile: Optional[str] = None
+
+EXPERIAN_SCORE_FACTORS = [
+    {
+        "factorCode": "38",
+        "factorText": "Proportion of balance to limit is too high on revolving accounts"
+    }
+]
+
+class ExperianAccount(msgspec.Struct, omit_defaults=True):
+    accountNumber: str
+    accountType: str
+    dateOpened: str
+    dateReported: str
+    paymentPattern: List[PaymentEntry]
+    accountStatus: str
+    creditorName: str
+    creditLimit: Optional[int] = None
+    balance: Optional[int] = None
+    pastDueAmount: Optional[int] = None
+    originalLoanAmount: Optional[int] = None
+    monthlyPayment: Optional[int] = None
+    remainingBalance: Optional[int] = None
+
+class ExperianInquiry(msgspec.Struct):
+    inquiryDate: str
+    subscriberName: str
+    inquiryType: str
+
+# All Experian builders take (n, good_profile) so the dispatch call site is
+# uniform; only the credit-card fields depend on the profile
+def _experian_credit_card_fields(n, good_profile):
+    names = random.choices(CREDIT_CARDS, k=n)
+    limits = rng.integers(1000, 25001, size=n).tolist()
+    balances = rng.integers(0, 10001, size=n).tolist()
+    past_dues = [0] * n if good_profile else rng.integers(0, 501, size=n).tolist()
+    return [{"creditorName": name, "creditLimit": limit, "balance": balance,
+             "pastDueAmount": past_due}
+            for name, limit, balance, past_due in zip(names, limits, balances, past_dues)]
+
+def _experian_auto_loan_fields(n, good_profile):
+    names = random.choices(AUTO_LENDERS, k=n)
+    amounts = rng.integers(10000, 50001, size=n).tolist()
+    payments = rng.integers(200, 601, size=n).tolist()
+    balances = rng.integers(5000, 40001, size=n).tolist()
+    return [{"creditorName": name, "originalLoanAmount": amount, "monthlyPayment": payment,
+             "remainingBalance": balance}
+            for name, amount, payment, balance in zip(names, amounts, payments, balances)]
+
+def _experian_mortgage_fields(n, good_profile):
+    names = random.choices(BANKS, k=n)
+    amounts = rng.integers(100000, 500001, size=n).tolist()
+    payments = rng.integers(800, 3501, size=n).tolist()
+    balances = rng.integers(50000, 450001, size=n).tolist()
+    return [{"creditorName": name, "originalLoanAmount": amount, "monthlyPayment": payment,
+             "remainingBalance": balance}
+            for name, amount, payment, balance in zip(names, amounts, payments, balances)]
+
+EXPERIAN_ACCOUNT_BUILDERS = {
+    "credit_card": _experian_credit_card_fields,
+    "auto_loan": _experian_auto_loan_fields,
+    "mortgage": _experian_mortgage_fields
+}
+
 def generate_experian_report(first_name, last_name, middle_initial, ssn, dob,
-                            profile_range, profile_data, current_addr, former_addr, num_accounts):
+                            profile_range, profile_data, addresses, num_accounts, now):
     accounts = []
-    for _ in range(num_accounts):
-        account_type = random.choice(["credit_card", "auto_loan", "mortgage"])
-        account = {
-            "accountNumber": f"****{random.randint(1000, 9999)}",
-            "accountType": account_type.replace("_", " ").title(),
-            "dateOpened": generate_iso_date(),
-            "dateReported": generate_iso_date(365),
-            "paymentPattern": generate_payment_history(profile_range, "experian"),
-            "accountStatus": "Open" if random.random() > 0.3 else "Closed"
-        }
-        
-        if account_type == "credit_card":
-            account.update({
-                "creditorName": random.choice(CREDIT_CARDS),
-                "creditLimit": random.randint(1000, 25000),
-                "balance": random.randint(0, 10000),
-                "pastDueAmount": 0 if profile_range in ["excellent", "good"] else random.randint(0, 500)
-            })
-        elif account_type == "auto_loan":
-            account.update({
-                "creditorName": random.choice(AUTO_LENDERS),
-                "originalLoanAmount": random.randint(10000, 50000),
-                "monthlyPayment": random.randint(200, 600),
-                "remainingBalance": random.randint(5000, 40000)
-            })
-        else:
-            account.update({
-                "creditorName": random.choice(BANKS),
-                "originalLoanAmount": random.randint(100000, 500000),
-                "monthlyPayment": random.randint(800, 3500),
-                "remainingBalance": random.randint(50000, 450000)
-            })
-        accounts.append(account)
+    type_counts = np.bincount(
+        rng.integers(0, len(ACCOUNT_TYPES), size=num_accounts),
+        minlength=len(ACCOUNT_TYPES)
+    )
+    good_profile = profile_range in ("excellent", "good")
+    for account_type, n in zip(ACCOUNT_TYPES, type_counts):
+        n = int(n)
+        if n == 0:
+            continue
+        account_suffixes = rng.integers(1000, 10000, size=n).tolist()
+        open_flags = (rng.random(n) > 0.3).tolist()
+        account_type_name = account_type.replace("_", " ").title()
+        typed_fields = EXPERIAN_ACCOUNT_BUILDERS[account_type](n, good_profile)
+        for i in range(n):
+            accounts.append(ExperianAccount(
+                accountNumber=f"****{account_suffixes[i]}",
+                accountType=account_type_name,
+                dateOpened=generate_iso_date(now),
+                dateReported=generate_iso_date(now, 365),
+                paymentPattern=generate_payment_history(profile_range, "experian"),
+                accountStatus="Open" if open_flags[i] else "Closed",
+                **typed_fields[i]
+            ))
     
-    return {
-        "bureau": "Experian",
-        "creditProfile": {
-            "consumerIdentity": {
-                "name": {
-                    "firstName": first_name,
-                    "middleName": middle_initial,
-                    "lastName": last_name
-                },
-                "ssn": ssn,
-                "dateOfBirth": dob,
-                "addresses": [
-                    {
-                        "addressType": "Current",
-                        "streetAddress": current_addr["addressLine1"],
-                        "city": current_addr["cityName"],
-                        "state": current_addr["stateAbbreviation"],
-                        "zipCode": current_addr["zipCode"]
-                    },
-                    {
-                        "addressType": "Previous",
-                        "streetAddress": former_addr["addressLine1"],
-                        "city": former_addr["cityName"],
-                        "state": former_addr["stateAbbreviation"],
-                        "zipCode": former_addr["zipCode"]
-                    }
-                ]
-            },
-            "creditAccounts": accounts,
-            "creditScore": {
-                "scoreName": "Experian/Fair Isaac Risk Model V2",
-                "scoreValue": profile_data["score"],
-                "scoreFactors": [
-                    {
-                        "factorCode": "38",
-                        "factorText": "Proportion of balance to limit is too high on revolving accounts"
-                    }
-                ]
-            },
-            "inquiries": [
-                {
-                    "inquiryDate": generate_iso_date(180),
-                    "subscriberName": random.choice(BANKS),
-                    "inquiryType": "Hard"
-                }
-                for _ in range(random.randint(0, 3))
+    return ExperianReport(
+        bureau="Experian",
+        creditProfile=ExperianCreditProfile(
+            consumerIdentity=ExperianConsumerIdentity(
+                name=ExperianName(
+                    firstName=first_name,
+                    middleName=middle_initial,
+                    lastName=last_name
+                ),
+                ssn=ssn,
+                dateOfBirth=dob,
+                addresses=addresses
+            ),
+            creditAccounts=accounts,
+            creditScore=ExperianCreditScore(
+                scoreName="Experian/Fair Isaac Risk Model V2",
+                scoreValue=profile_data["score"],
+                scoreFactors=EXPERIAN_SCORE_FACTORS
+            ),
+            inquiries=[
+                ExperianInquiry(
+                    inquiryDate=generate_iso_date(now, 180),
+                    subscriberName=BANKS[i],
+                    inquiryType="Hard"
+                )
+                for i in rng.integers(0, len(BANKS), size=rng.integers(0, 4))
             ]
-        }
-    }
+        )
+    )
 
 # Models
-class ReportGenerateRequest(BaseModel):
-    bureau: Bureau = Bureau.ALL
-    credit_profile: CreditProfile = CreditProfile.RANDOM
-    num_accounts: Optional[int] = None
-    include_employment: bool = True
-
 class ReportGenerateResponse(BaseModel):
     report_ids: Dict[str, str]
     message: str
@@ -422,54 +728,149 @@ class ReportGenerateResponse(BaseModel):
     bureaus_generated: List[str]
 
 # Main generation function
-def generate_credit_reports(request: ReportGenerateRequest):
-    first_name = random.choice(FIRST_NAMES)
-    middle_initial = chr(random.randint(65, 90))
-    last_name = random.choice(LAST_NAMES)
+def _build_reports(bureau, credit_profile, num_accounts=None):
+    """Build report dict trees without touching the store.
+
+    Has no side effects on module state, so it can run in a worker process;
+    the caller inserts the returned reports into the store.
+    """
+    first_name = FIRST_NAMES[rng.integers(0, len(FIRST_NAMES))]
+    middle_initial = chr(65 + rng.integers(0, 26))
+    last_name = LAST_NAMES[rng.integers(0, len(LAST_NAMES))]
     ssn = generate_ssn()
     dob = generate_dob()
-    
-    profile_range, profile_data = get_credit_profile(request.credit_profile.value)
+
+    profile_range, profile_data = get_credit_profile(credit_profile.value)
     current_addr = generate_address()
     former_addr = generate_address()
-    num_accounts = request.num_accounts or random.randint(2, 8)
-    
-    reports = {}
-    bureaus_to_generate = []
-    
-    if request.bureau == Bureau.ALL:
+    num_accounts = num_accounts or int(rng.integers(2, 9))
+    now = datetime.now()
+
+    # Build each bureau's address sub-docs once; with bureau=all the same
+    # dicts are referenced by every report instead of rebuilt per generator
+    equifax_addresses = [current_addr, former_addr]
+    transunion_addresses = [
+        {
+            "type": "Current",
+            "street": current_addr["addressLine1"],
+            "city": current_addr["cityName"],
+            "state": current_addr["stateAbbreviation"],
+            "zip": current_addr["zipCode"]
+        },
+        {
+            "type": "Prior",
+            "street": former_addr["addressLine1"],
+            "city": former_addr["cityName"],
+            "state": former_addr["stateAbbreviation"],
+            "zip": former_addr["zipCode"]
+        }
+    ]
+    experian_addresses = [
+        {
+            "addressType": "Current",
+            "streetAddress": current_addr["addressLine1"],
+            "city": current_addr["cityName"],
+            "state": current_addr["stateAbbreviation"],
+            "zipCode": current_addr["zipCode"]
+        },
+        {
+            "addressType": "Previous",
+            "streetAddress": former_addr["addressLine1"],
+            "city": former_addr["cityName"],
+            "state": former_addr["stateAbbreviation"],
+            "zipCode": former_addr["zipCode"]
+        }
+    ]
+
+    built = []
+
+    if bureau == Bureau.ALL:
         bureaus_to_generate = [Bureau.EQUIFAX, Bureau.TRANSUNION, Bureau.EXPERIAN]
     else:
-        bureaus_to_generate = [request.bureau]
-    
+        bureaus_to_generate = [bureau]
+
     for bureau in bureaus_to_generate:
-        report_id = str(uuid.uuid4())
-        
+        # 128 bits of entropy like uuid4, without the UUID object overhead
+        report_id = urandom(16).hex()
+
         if bureau == Bureau.EQUIFAX:
             report = generate_equifax_report(
                 first_name, last_name, middle_initial, ssn, dob,
-                profile_range, profile_data, current_addr, former_addr, num_accounts
+                profile_range, profile_data, equifax_addresses, num_accounts, now
             )
         elif bureau == Bureau.TRANSUNION:
             report = generate_transunion_report(
                 first_name, last_name, middle_initial, ssn, dob,
-                profile_range, profile_data, current_addr, former_addr, num_accounts
+                profile_range, profile_data, transunion_addresses, num_accounts, now
             )
         else:  # EXPERIAN
             report = generate_experian_report(
                 first_name, last_name, middle_initial, ssn, dob,
-                profile_range, profile_data, current_addr, former_addr, num_accounts
+                profile_range, profile_data, experian_addresses, num_accounts, now
             )
-        
+
         # Add metadata without overwriting existing structure
-        report["reportId"] = report_id
-        report["generatedDate"] = datetime.now().isoformat()
-        report["riskProfile"] = profile_range  # Use different key name to avoid conflicts
-        
-        credit_reports_db[report_id] = report
-        reports[bureau.value] = report_id
-    
-    return reports, f"{first_name} {last_name}", profile_data["score"], [b.value for b in bureaus_to_generate]
+        report.reportId = report_id
+        report.generatedDate = now.isoformat()
+        report.riskProfile = profile_range  # Use different key name to avoid conflicts
+
+        meta = {
+            "report_id": report_id,
+            "bureau": report.bureau,
+            "generated_date": report.generatedDate,
+            "risk_profile": profile_range
+        }
+        built.append((report_id, report, meta, bureau.value))
+
+    return built, f"{first_name} {last_name}", profile_data["score"], [b.value for b in bureaus_to_generate]
+
+def generate_credit_reports(bureau, credit_profile, num_accounts=None):
+    built, consumer_name, score, bureaus = _build_reports(bureau, credit_profile, num_accounts)
+    reports = {}
+    for report_id, report, meta, bureau_value in built:
+        _store_report(report_id, report, meta, bureau_value)
+        reports[bureau_value] = report_id
+    return reports, consumer_name, score, bureaus
+
+# Chunk size for bulk generation; large enough that executor dispatch
+# overhead is negligible per report
+GENERATION_BATCH_SIZE = 25
+
+def _build_batch(count, bureau, credit_profile):
+    return [_build_reports(bureau, credit_profile) for _ in range(count)]
+
+# Process pool for bulk generation: the work is pure-CPU Python, so threads
+# share one GIL while processes scale across cores. Created lazily because
+# workers fork/spawn from this module.
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+def _reseed_worker():
+    """Give each worker its own RNG state instead of a copy of the parent's"""
+    global rng
+    rng = np.random.default_rng()
+    random.seed()
+
+def _get_process_pool():
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(), initializer=_reseed_worker
+                )
+    return _process_pool
+
+async def _stream_summaries(ids):
+    """Yield one cached summary blob per line (NDJSON).
+
+    Bytes hit the wire as they are produced, so peak memory stays flat no
+    matter how many reports match. Entries evicted mid-stream are skipped.
+    """
+    for rid in ids:
+        line = report_summary_bytes.get(rid)
+        if line is not None:
+            yield line + b"\n"
 
 # API Endpoints
 @app.get("/")
@@ -482,10 +883,18 @@ async def root():
     }
 
 @app.post("/api/reports/generate", response_model=ReportGenerateResponse)
-async def create_credit_report(request: ReportGenerateRequest = ReportGenerateRequest()):
+async def create_credit_report(
+    bureau: Bureau = Body(Bureau.ALL),
+    credit_profile: CreditProfile = Body(CreditProfile.RANDOM),
+    num_accounts: Optional[int] = Body(None, ge=1),
+    include_employment: bool = Body(True)
+):
     """Generate credit report(s) for selected bureau(s)"""
     try:
-        report_ids, consumer_name, credit_score, bureaus = generate_credit_reports(request)
+        # Generation is pure CPU work; keep it off the event loop
+        report_ids, consumer_name, credit_score, bureaus = await run_in_threadpool(
+            generate_credit_reports, bureau, credit_profile, num_accounts
+        )
         
         return ReportGenerateResponse(
             report_ids=report_ids,
@@ -504,15 +913,24 @@ async def generate_unlimited_reports(
     credit_profile: CreditProfile = CreditProfile.RANDOM
 ):
     """Generate unlimited reports"""
-    total_generated = 0
-    
-    for _ in range(count):
-        request = ReportGenerateRequest(bureau=bureau, credit_profile=credit_profile)
-        generate_credit_reports(request)
-        total_generated += 1
-    
+    # Split the work into chunks built in parallel across worker processes;
+    # only the cheap store inserts happen on this side
+    batches = [GENERATION_BATCH_SIZE] * (count // GENERATION_BATCH_SIZE)
+    if count % GENERATION_BATCH_SIZE:
+        batches.append(count % GENERATION_BATCH_SIZE)
+
+    pool = _get_process_pool()
+    loop = asyncio.get_running_loop()
+    batch_results = await asyncio.gather(
+        *(loop.run_in_executor(pool, _build_batch, size, bureau, credit_profile) for size in batches)
+    )
+    for batch in batch_results:
+        for built, _, _, _ in batch:
+            for report_id, report, meta, bureau_value in built:
+                _store_report(report_id, report, meta, bureau_value)
+
     return {
-        "message": f"Generated {total_generated} report(s)",
+        "message": f"Generated {count} report(s)",
         "total_in_system": len(credit_reports_db)
     }
 
@@ -525,36 +943,33 @@ async def get_random_report(bureau: Optional[str] = None):
     """
     if not credit_reports_db:
         raise HTTPException(status_code=404, detail="No reports available. Generate some first!")
-    
+
     # Filter by bureau if specified
     if bureau:
-        filtered_reports = {
-            rid: report for rid, report in credit_reports_db.items()
-            if report.get("bureau", "").lower() == bureau.lower()
-        }
-        
-        if not filtered_reports:
+        filtered_ids = bureau_index.get(bureau.lower())
+
+        if not filtered_ids:
             raise HTTPException(
-                status_code=404, 
+                status_code=404,
                 detail=f"No {bureau} reports found. Available bureaus: equifax, transunion, experian"
             )
-        
-        random_id = random.choice(list(filtered_reports.keys()))
-        return {
+
+        random_id = random.choice(filtered_ids)
+        # Return the response directly so the cached fragment skips jsonable_encoder
+        return ORJSONResponse({
             "report_id": random_id,
-            "report": filtered_reports[random_id],
+            "report": orjson.Fragment(report_bytes_db[random_id]),
             "message": f"Random {bureau.title()} report"
-        }
-    
+        })
+
     # Get any random report
-    random_id = random.choice(list(credit_reports_db.keys()))
-    report = credit_reports_db[random_id]
-    
-    return {
+    random_id = report_ids[random.randrange(len(report_ids))]
+
+    return ORJSONResponse({
         "report_id": random_id,
-        "report": report,
-        "message": f"Random {report.get('bureau', 'unknown')} report"
-    }
+        "report": orjson.Fragment(report_bytes_db[random_id]),
+        "message": f"Random {report_meta[random_id]['bureau']} report"
+    })
 
 @app.get("/api/reports/random/simple")
 async def get_random_report_simple(bureau: Optional[str] = None):
@@ -567,25 +982,22 @@ async def get_random_report_simple(bureau: Optional[str] = None):
         raise HTTPException(status_code=404, detail="No reports available")
     
     if bureau:
-        filtered_reports = [
-            rid for rid, report in credit_reports_db.items()
-            if report.get("bureau", "").lower() == bureau.lower()
-        ]
-        
-        if not filtered_reports:
+        filtered_ids = bureau_index.get(bureau.lower())
+
+        if not filtered_ids:
             raise HTTPException(status_code=404, detail=f"No {bureau} reports found")
-        
-        random_id = random.choice(filtered_reports)
+
+        random_id = random.choice(filtered_ids)
     else:
-        random_id = random.choice(list(credit_reports_db.keys()))
-    
-    report = credit_reports_db[random_id]
-    
+        random_id = report_ids[random.randrange(len(report_ids))]
+
+    meta = report_meta[random_id]
+
     return {
         "report_id": random_id,
-        "bureau": report.get("bureau"),
-        "generated_date": report.get("generatedDate"),
-        "risk_profile": report.get("riskProfile"),
+        "bureau": meta["bureau"],
+        "generated_date": meta["generated_date"],
+        "risk_profile": meta["risk_profile"],
         "url": f"/api/reports/{random_id}"
     }
 
@@ -604,75 +1016,54 @@ async def get_random_reports_batch(
         raise HTTPException(status_code=404, detail="No reports available")
     
     if bureau:
-        filtered_reports = [
-            rid for rid, report in credit_reports_db.items()
-            if report.get("bureau", "").lower() == bureau.lower()
-        ]
-        
-        if not filtered_reports:
+        filtered_ids = bureau_index.get(bureau.lower())
+
+        if not filtered_ids:
             raise HTTPException(status_code=404, detail=f"No {bureau} reports found")
-        
-        available_reports = filtered_reports
+
+        available_reports = filtered_ids
     else:
-        available_reports = list(credit_reports_db.keys())
-    
+        available_reports = report_ids
+
     # Get random sample (without replacement if possible)
     sample_size = min(count, len(available_reports))
     random_ids = random.sample(available_reports, sample_size)
-    
-    results = []
-    for rid in random_ids:
-        report = credit_reports_db[rid]
-        results.append({
-            "report_id": rid,
-            "bureau": report.get("bureau"),
-            "generated_date": report.get("generatedDate"),
-            "risk_profile": report.get("riskProfile")
-        })
-    
-    return {
-        "count": len(results),
-        "reports": results
-    }
+
+    return StreamingResponse(
+        _stream_summaries(random_ids),
+        media_type="application/x-ndjson",
+        headers={"X-Report-Count": str(sample_size)}
+    )
 
 @app.get("/api/reports/bureau/{bureau_name}")
 async def get_reports_by_bureau(bureau_name: str):
-    """Get all reports for a specific bureau"""
-    bureau_reports = [
-        {
-            "report_id": rid,
-            "bureau": report["bureau"],
-            "generated_date": report["generatedDate"]
-        }
-        for rid, report in credit_reports_db.items()
-        if report.get("bureau", "").lower() == bureau_name.lower()
-    ]
-    return {"bureau": bureau_name, "count": len(bureau_reports), "reports": bureau_reports}
+    """Stream all reports for a specific bureau as NDJSON"""
+    # Snapshot the id list so eviction during streaming can't shift it
+    ids = list(bureau_index.get(bureau_name.lower(), ()))
+    return StreamingResponse(
+        _stream_summaries(ids),
+        media_type="application/x-ndjson",
+        headers={"X-Bureau": bureau_name, "X-Report-Count": str(len(ids))}
+    )
 
 @app.get("/api/reports/{report_id}")
 async def get_credit_report(report_id: str):
     """Retrieve a credit report by ID"""
-    if report_id not in credit_reports_db:
+    if report_id not in report_bytes_db:
         raise HTTPException(status_code=404, detail=f"Report {report_id} not found")
-    return credit_reports_db[report_id]
+    return Response(content=report_bytes_db[report_id], media_type="application/json")
 
 @app.get("/api/stats")
 async def get_statistics():
     """Get statistics"""
     if not credit_reports_db:
         return {"total_reports": 0}
-    
-    bureau_counts = {"equifax": 0, "transunion": 0, "experian": 0}
-    for report in credit_reports_db.values():
-        bureau = report.get("bureau", "").lower()
-        if bureau in bureau_counts:
-            bureau_counts[bureau] += 1
-    
+
     return {
         "total_reports": len(credit_reports_db),
-        "by_bureau": bureau_counts
+        "by_bureau": dict(bureau_counts)
     }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")